@@ -1,4 +1,3 @@
-import copy
 from dataclasses import dataclass, field
 import enum
 from lib2to3.pytree import Base
@@ -105,7 +104,7 @@ class Action:
 
 
         """
-        spec = copy.deepcopy(spec)
+        spec = dict(spec)  # only top-level keys are replaced or removed below
         spec["commands"] = [Command.from_spec(i) for i in spec.get("commands", [])]
         spec["input_file_generators"] = [
             InputFileGenerator.from_spec(label, info, parameters, cmd_files)
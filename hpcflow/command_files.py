@@ -91,10 +91,9 @@ class OutputFileParser:
     @classmethod
     def from_spec(cls, param_typ, info, parameters, cmd_files):
         output = parameters[param_typ]
-        output_files = [
-            [j for j in cmd_files if j.label == label][0]
-            for label in info["from_files"]
-        ]
+        # reversed, so that the first file with a given label is used:
+        cmd_files_by_label = {i.label: i for i in reversed(cmd_files)}
+        output_files = [cmd_files_by_label[label] for label in info["from_files"]]
         return cls(output, output_files)
 
 
@@ -116,8 +115,7 @@ class _FileContentsSpecifier:
     @property
     def contents(self):
         if self.path is not None:
-            with self.path.open("r") as fh:
-                contents = fh.read()
+            contents = self.path.read_text()
         else:
             contents = self._contents
         return contents
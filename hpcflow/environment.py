@@ -43,10 +43,12 @@ class ExecutableInstance:
     command: str
 
     def __post_init__(self):
+        if isinstance(self.num_cores, NumCores):
+            # already validated, e.g. when copied from another instance:
+            return
         if not isinstance(self.num_cores, dict):
             self.num_cores = {"start": self.num_cores, "stop": self.num_cores}
-        if not isinstance(self.num_cores, NumCores):
-            self.num_cores = NumCores(**self.num_cores)
+        self.num_cores = NumCores(**self.num_cores)
 
     def __eq__(self, other):
         if (
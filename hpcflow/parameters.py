@@ -1,6 +1,8 @@
+import copy
 from dataclasses import dataclass, field
 import enum
-from typing import Any, List, Optional, Sequence, Union
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple, Union
 import numpy as np
 from hpcflow.element import ElementFilter
 from hpcflow.errors import InputSourceValidationError
@@ -18,6 +20,8 @@ from hpcflow.utils import check_valid_py_identifier
 Address = List[Union[int, float, str]]
 Numeric = Union[int, float, np.number]
 
+_ATOMIC_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
 
 class ParameterPropagationMode(enum.Enum):
 
@@ -42,6 +46,11 @@ class Parameter:
     def __post_init__(self):
         self.typ = check_valid_py_identifier(self.typ)
 
+    def __deepcopy__(self, memo):
+        # parameters are not modified after construction, so can be shared by copies of
+        # the objects that reference them:
+        return self
+
     @classmethod
     def from_spec(cls, spec):
         spec["typ"] = spec.pop("type")
@@ -50,6 +59,9 @@ class Parameter:
 
 @dataclass
 class SubParameter:
+
+    __slots__ = ("address", "parameter")
+
     address: Address
     parameter: Parameter
 
@@ -60,10 +72,9 @@ class SchemaParameter:
     def from_spec(cls, spec, parameters):
         spec["parameter"] = parameters[spec["parameter"]]
         prop_mode = spec.get("propagation_mode")
-        if prop_mode:
-            spec["propagation_mode"] = getattr(
-                ParameterPropagationMode, prop_mode.upper()
-            )
+        if prop_mode and not isinstance(prop_mode, ParameterPropagationMode):
+            # look up by member name, rather than via `getattr` on the enum class:
+            spec["propagation_mode"] = ParameterPropagationMode[prop_mode.upper()]
         return cls(**spec)
 
     @property
@@ -139,6 +150,9 @@ class BuiltinSchemaParameter:
 
 @dataclass
 class ValueSequence:
+
+    __slots__ = ("path", "values", "nesting_order")
+
     path: Sequence[Union[str, int, float]]
     values: List[Any]
     nesting_order: int
@@ -167,13 +181,13 @@ class ValueSequence:
 
     @classmethod
     def from_linear_space(cls, start, stop, num=50, address=None, **kwargs):
-        values = list(np.linspace(start, stop, num=num, **kwargs))
+        values = np.linspace(start, stop, num=num, **kwargs).tolist()
         return cls(values, address=address)
 
     @classmethod
     def from_range(cls, start, stop, step=1, address=None):
         if isinstance(step, int):
-            return cls(values=list(np.arange(start, stop, step)), address=address)
+            return cls(values=np.arange(start, stop, step).tolist(), address=address)
         else:
             # Use linspace for non-integer step, as recommended by Numpy:
             return cls.from_linear_space(
@@ -216,6 +230,17 @@ class InputValue(AbstractInputValue):
     def __post_init__(self):
         self._validate()
 
+    def __deepcopy__(self, memo):
+        # the parameter is shared (see `Parameter.__deepcopy__`), and immutable values do
+        # not need to go through the deepcopy machinery:
+        obj = copy.copy(self)
+        memo[id(self)] = obj
+        if self.path is not None:
+            obj.path = copy.deepcopy(self.path, memo)
+        if not isinstance(self.value, _ATOMIC_TYPES):
+            obj.value = copy.deepcopy(self.value, memo)
+        return obj
+
     @property
     def is_sub_value(self):
         """True if the value is for a sub part of the parameter (i.e. if `path` is set).
@@ -243,6 +268,58 @@ class InputValue(AbstractInputValue):
         return cls(**spec)
 
 
+# source types and the number of dot-delimited parts in a source of that type:
+_INPUT_SOURCE_TYPES = {"imports": 2, "tasks": 3, "local": 1, "default": 1}
+_INPUT_SOURCE_TASK_SOURCE_TYPES = ("inputs", "outputs")
+
+
+@lru_cache(maxsize=1024)
+def _parse_input_source(source: str) -> Tuple:
+    """Split an `InputSource` source string into a tuple of: source type, task
+    reference, task source type and imports reference, where inapplicable parts are
+    `None`.
+
+    Notes
+    -----
+    Templates typically repeat the same few source strings many times, so the parsed
+    results are cached. The returned tuple contains only strings and `None`, so is safe
+    to share.
+
+    """
+    source_lower = source if source.islower() else source.lower()
+    # sources without a task/imports reference (e.g. "local") need no splitting:
+    parts = source_lower.split(".") if "." in source_lower else (source_lower,)
+    source_type = parts[0]
+    task_ref = None
+    task_source_type = None
+    imports_ref = None
+
+    num_parts = _INPUT_SOURCE_TYPES.get(source_type)
+    if num_parts is None:
+        raise ValueError(
+            f"InputSource `source` specified as {source_type!r}, but must be one "
+            f"of: {list(_INPUT_SOURCE_TYPES)!r}."
+        )
+    if len(parts) != num_parts:
+        raise ValueError(f"InputSource source not understood: {source!r}.")
+
+    if source_type == "tasks":
+        task_ref = parts[1]
+        task_source_type = parts[2]
+        if task_source_type not in _INPUT_SOURCE_TASK_SOURCE_TYPES:
+            raise ValueError(
+                f"InputSource `source` with source type 'tasks' must be in the format: "
+                f"'tasks.[task_reference].inputs' or 'tasks.[task_reference].outputs', "
+                f"where [task_reference] is the unique name of a workflow task, specified "
+                f"source was: {source!r}."
+            )
+
+    elif source_type == "imports":
+        imports_ref = parts[1]
+
+    return source_type, task_ref, task_source_type, imports_ref
+
+
 @dataclass
 class InputSource:
     source: str
@@ -250,51 +327,26 @@ class InputSource:
 
     # TODO: validate and split?
 
+    _NO_FILTER_SOURCE_TYPES = ("local", "default")  # `where` is not supported
+
     def __post_init__(self):
         self._validate()
 
     def _validate(self):
 
-        parts = self.source.lower().split(".")
-        source_type = parts[0]
-
-        allowed = ["imports", "tasks", "local", "default"]
-        if source_type not in allowed:
-            raise ValueError(
-                f"InputSource `source` specified as {source_type!r}, but must be one "
-                f"of: {allowed!r}."
-            )
-
-        if source_type == "tasks":
-            task_ref = parts[1]
-            task_source_type = parts[2]
-            allowed_task_types = ["inputs", "outputs"]
-            if task_source_type not in allowed_task_types:
-                raise ValueError(
-                    f"InputSource `source` with source type 'tasks' must be in the format: "
-                    f"'tasks.[task_reference].inputs' or 'tasks.[task_reference].outputs', "
-                    f"where [task_reference] is the unique name of a workflow task, specified "
-                    f"source was: {self.source!r}."
-                )
-            self._task_ref = task_ref
-            self._task_source_type = task_source_type
-
-        elif source_type == "imports":
-            self._imports_ref = parts[1]
-
-        if (source_type == "local" and len(parts) > 1) or (
-            source_type == "imports" and len(parts) > 2
-        ):
-            raise ValueError(f"InputSource source not understood: {self.source!r}.")
+        (
+            self._source_type,
+            self._task_ref,
+            self._task_source_type,
+            self._imports_ref,
+        ) = _parse_input_source(self.source)
 
-        if source_type in ["local", "default"] and self.where is not None:
+        if self._source_type in self._NO_FILTER_SOURCE_TYPES and self.where is not None:
             raise ValueError(
                 f"Element filter via the `where` argument is not supported for InputSource "
-                f"with source type {source_type!r}."
+                f"with source type {self._source_type!r}."
             )
 
-        self._source_type = source_type
-
     @property
     def source_type(self):
         return self._source_type
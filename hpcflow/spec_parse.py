@@ -1,5 +1,6 @@
 """Module containing logic for parsing workflow spec files/strings."""
 
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
 
@@ -18,30 +19,33 @@ from hpcflow.workflow import WorkflowTemplate
 from hpcflow.environment import Executable, ExecutableInstance, Environment
 
 
+@lru_cache(maxsize=None)
+def _get_spec_schema(file_name):
+    """Load a Valida schema from a YAML file within the `hpcflow.data` package.
+
+    Notes
+    -----
+    The schema files are bundled with the package, so each is only parsed once per
+    process, however many spec files are validated against it.
+
+    """
+    return Schema.from_yaml(resources.read_text("hpcflow.data", file_name))
+
+
 def get_workflow_spec_schema():
-    with resources.open_text("hpcflow.data", "workflow_spec_schema.yaml") as fh:
-        schema_dat = fh.read()
-    schema = Schema.from_yaml(schema_dat)
-    return schema
+    return _get_spec_schema("workflow_spec_schema.yaml")
 
 
 def get_task_schema_spec_schema():
-    with resources.open_text("hpcflow.data", "task_schema_spec_schema.yaml") as fh:
-        schema_dat = fh.read()
-    schema = Schema.from_yaml(schema_dat)
-    return schema
+    return _get_spec_schema("task_schema_spec_schema.yaml")
 
 
 def get_environment_spec_schema():
-    with resources.open_text("hpcflow.data", "environments_spec_schema.yaml") as fh:
-        schema_dat = fh.read()
-    schema = Schema.from_yaml(schema_dat)
-    return schema
+    return _get_spec_schema("environments_spec_schema.yaml")
 
 
 def get_task_schemas_and_parameters():
-    with resources.open_text("hpcflow.data", "task_schemas.yaml") as fh:
-        yaml_str = fh.read()
+    yaml_str = resources.read_text("hpcflow.data", "task_schemas.yaml")
 
     yaml = YAML(typ="safe")
     task_schemas_dat = yaml.load(yaml_str)
@@ -71,8 +75,7 @@ def get_task_schemas_and_parameters():
 
 
 def get_environments():
-    with resources.open_text("hpcflow.data", "environments.yaml") as fh:
-        yaml_str = fh.read()
+    yaml_str = resources.read_text("hpcflow.data", "environments.yaml")
 
     yaml = YAML(typ="safe")
     envs_dat = yaml.load(yaml_str)
@@ -88,9 +91,7 @@ def get_environments():
 
 def parse_YAML_spec_file(yaml_file):
     """Generate a WorkflowTemplate from a YAML string."""
-    with Path(yaml_file).open("r") as fh:
-        yaml_str = fh.read()
-    return parse_YAML_spec_str(yaml_str)
+    return parse_YAML_spec_str(Path(yaml_file).read_text())
 
 
 def parse_YAML_spec_str(yaml_str):
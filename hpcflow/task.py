@@ -45,7 +45,12 @@ class TaskTemplate:
         "_nesting_order",
         "_groups",
         "_name",
+        "_all_schema_inputs",  # assigned in _validate()
+        "_all_schema_outputs",  # assigned in _validate()
+        "_all_schema_input_types",  # assigned in _validate()
+        "_all_schema_output_types",  # assigned in _validate()
         "_defined_input_types",  # assigned in _validate()
+        "_undefined_input_types",  # assigned in _validate()
     )
 
     def __init__(
@@ -94,6 +99,16 @@ class TaskTemplate:
                 f"objective, but found multiple objectives: {list(names)!r}"
             )
 
+        # schemas are fixed for the lifetime of the task template, so these are reused:
+        self._all_schema_inputs = tuple(
+            inp_j for schema_i in self.schemas for inp_j in schema_i.inputs
+        )
+        self._all_schema_outputs = tuple(
+            out_j for schema_i in self.schemas for out_j in schema_i.outputs
+        )
+        self._all_schema_input_types = {i.typ for i in self._all_schema_inputs}
+        self._all_schema_output_types = {i.typ for i in self._all_schema_outputs}
+
         input_types = [
             i.parameter.typ for i in self.get_non_sub_parameter_input_values()
         ]
@@ -118,19 +133,23 @@ class TaskTemplate:
                 )
 
         self._defined_input_types = set(input_types)
+        self._undefined_input_types = (
+            self._all_schema_input_types - self._defined_input_types
+        )
 
     def _get_name(self):
-        out = f"{self.objective.name}"
+        parts = [self.objective.name]
+        num_schemas = len(self.schemas)
         for idx, schema_i in enumerate(self.schemas, start=1):
-            need_and = idx < len(self.schemas) and (
+            if schema_i.method:
+                parts.append(f"_{schema_i.method}")
+            if schema_i.implementation:
+                parts.append(f"_{schema_i.implementation}")
+            if idx < num_schemas and (
                 self.schemas[idx].method or self.schemas[idx].implementation
-            )
-            out += (
-                f"{f'_{schema_i.method}' if schema_i.method else ''}"
-                f"{f'_{schema_i.implementation}' if schema_i.implementation else ''}"
-                f"{f'_and' if need_and else ''}"
-            )
-        return out
+            ):
+                parts.append("_and")
+        return "".join(parts)
 
     @classmethod
     def from_spec(cls, spec, all_schemas, all_parameters):
@@ -147,11 +166,9 @@ class TaskTemplate:
         inputs_spec = spec.pop("inputs", [])
         input_sources_spec = spec.pop("input_sources", {})
         perturbs_spec = spec.pop("perturbations", {})
-        nesting_order = spec.pop("nesting_order", {})
-
-        for k in list(nesting_order.keys()):
-            new_k = tuple(k.split("."))
-            nesting_order[new_k] = nesting_order.pop(k)
+        nesting_order = {
+            tuple(k.split(".")): v for k, v in spec.pop("nesting_order", {}).items()
+        }
 
         print(f"nesting_order: {nesting_order}")
 
@@ -262,21 +279,21 @@ class TaskTemplate:
 
     @property
     def all_schema_inputs(self) -> Tuple[SchemaInput]:
-        return tuple(inp_j for schema_i in self.schemas for inp_j in schema_i.inputs)
+        return self._all_schema_inputs
 
     @property
     def all_schema_outputs(self) -> Tuple[SchemaOutput]:
-        return tuple(inp_j for schema_i in self.schemas for inp_j in schema_i.outputs)
+        return self._all_schema_outputs
 
     @property
     def all_schema_input_types(self):
         """Get the set of all schema input types (over all specified schemas)."""
-        return {inp_j for schema_i in self.schemas for inp_j in schema_i.input_types}
+        return self._all_schema_input_types
 
     @property
     def all_schema_output_types(self):
         """Get the set of all schema output types (over all specified schemas)."""
-        return {out_j for schema_i in self.schemas for out_j in schema_i.output_types}
+        return self._all_schema_output_types
 
     @property
     def universal_input_types(self):
@@ -292,16 +309,12 @@ class TaskTemplate:
 
     @property
     def undefined_input_types(self):
-        return self.all_schema_input_types - self.defined_input_types
+        return self._undefined_input_types
 
     @property
     def undefined_inputs(self):
-        return [
-            inp_j
-            for schema_i in self.schemas
-            for inp_j in schema_i.inputs
-            if inp_j.typ in self.undefined_input_types
-        ]
+        undefined_types = self.undefined_input_types
+        return [i for i in self.all_schema_inputs if i.typ in undefined_types]
 
     @property
     def unsourced_inputs(self):
@@ -415,5 +428,6 @@ class Task:
     @property
     def unique_name(self):
         name_repeat_index = self.workflow.name_repeat_indices[self.index]
-        add_rep = f"{'_' + name_repeat_index if name_repeat_index > 1 else ''}"
-        return f"{self.template.name}{add_rep}"
+        if name_repeat_index > 1:
+            return f"{self.template.name}_{name_repeat_index}"
+        return self.template.name
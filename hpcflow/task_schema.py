@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import List, Optional, Union
 
 from hpcflow.actions import Action
@@ -82,7 +83,7 @@ class TaskSchema:
     def provides_parameters(self):
         return tuple(
             i
-            for i in self.inputs + self.outputs
+            for i in chain(self.inputs, self.outputs)
             if i.propagation_mode != ParameterPropagationMode.NEVER
         )
 
@@ -9,10 +9,12 @@ from typing import Mapping
 from hpcflow.errors import InvalidIdentifier
 
 
+_WORKFLOW_ID_CHARS = string.ascii_letters + string.digits
+_WORKFLOW_ID_LENGTH = 12
+
+
 def make_workflow_id():
-    length = 12
-    chars = string.ascii_letters + "0123456789"
-    return "".join(random.choices(chars, k=length))
+    return "".join(random.choices(_WORKFLOW_ID_CHARS, k=_WORKFLOW_ID_LENGTH))
 
 
 def get_time_stamp():
@@ -35,8 +37,8 @@ def get_duplicate_items(lst):
     [2, 3, 2]
 
     """
-    seen = []
-    return list(set(x for x in lst if x in seen or seen.append(x)))
+    seen = set()
+    return list(set(x for x in lst if x in seen or seen.add(x)))
 
 
 def check_valid_py_identifier(name):
@@ -55,10 +57,9 @@ def check_valid_py_identifier(name):
       - element group name
 
     """
-    trial_name = name[1:].replace("_", "")  # "internal" underscores are allowed
     if (
-        not name
-        or not (name[0].isalpha() and ((trial_name[1:] or "a").isalnum()))
+        not name.isidentifier()
+        or not name[0].isalpha()  # leading underscores are not allowed
         or keyword.iskeyword(name)
         or name == "add_object"  # method of `DotAccessObjectList`
     ):
@@ -169,23 +170,33 @@ def get_relative_path(path1, path2):
 
     """
 
-    len_path2 = len(path2)
-    msg = f"{path1!r} is not in the subpath of {path2!r}."
+    if not is_in_subpath(path1, path2):
+        raise ValueError(f"{path1!r} is not in the subpath of {path2!r}.")
+
+    return path1[len(path2) :]
+
 
-    if len(path1) < len_path2:
-        raise ValueError(msg)
+def is_in_subpath(path1, path2):
+    """Check if `path1` is equal to, or within, `path2`, where the paths are as described
+    in `get_relative_path`.
 
-    for i, j in zip(path1[:len_path2], path2):
-        if i != j:
-            raise ValueError(msg)
+    Examples
+    --------
+    >>> is_in_subpath(('A', 'B', 'C'), ('A',))
+    True
 
-    return path1[len_path2:]
+    >>> is_in_subpath(('A',), ('A', 'B'))
+    False
+
+    """
+    return len(path1) >= len(path2) and all(i == j for i, j in zip(path1, path2))
 
 
 def search_dir_files_by_regex(pattern, group=0, directory="."):
     vals = []
+    regex = re.compile(pattern)
     for i in Path(directory).iterdir():
-        match = re.search(pattern, i.name)
+        match = regex.search(i.name)
         if match:
             match_groups = match.groups()
             if match_groups:
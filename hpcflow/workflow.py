@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from operator import itemgetter
-from typing import List, Optional
+from typing import Dict, List, Optional
 from hpcflow.loop import Loop
 
 from hpcflow.object_list import TaskList
@@ -15,6 +15,7 @@ from hpcflow.utils import (
     get_in_container,
     get_relative_path,
     group_by_dict_key_values,
+    is_in_subpath,
     set_in_container,
 )
 
@@ -32,30 +33,52 @@ class WorkflowTemplate:
         self.tasks = TaskList()
         self.element_indices = []
         self.name_repeat_indices = []
+        self._task_name_counts = {}  # number of tasks added with a given template name
 
         for task_template in task_templates or []:
             self.add_task(task_template)
 
+    def _get_task_provided_parameters(self, new_index: int):
+        """Get the parameters provided by tasks up to `new_index`, keyed by parameter
+        type, and then by task index and unique name."""
+        provided = {}
+        for task in self.tasks[:new_index]:
+            params = task.template.provides_parameters
+            if not params:
+                continue
+            task_key = (task.index, task.unique_name)
+            for i in params:
+                provided.setdefault(i.typ, {}).setdefault(task_key, []).append(i)
+        return {
+            typ: {task_key: tuple(params) for task_key, params in task_params.items()}
+            for typ, task_params in provided.items()
+        }
+
     def get_possible_input_sources(
-        self, schema_input: SchemaInput, new_task: TaskTemplate, new_index: int
+        self,
+        schema_input: SchemaInput,
+        new_task: TaskTemplate,
+        new_index: int,
+        task_provided_parameters: Optional[Dict] = None,
     ):
         """Enumerate the possible sources for an input of a new task, given a proposed
-        placement of that task."""
+        placement of that task.
 
-        # Get parameters provided by tasks up to `new_index`:
-        task_sources = {}
-        for task in self.tasks[:new_index]:
-            provided = tuple(
-                i
-                for i in task.template.provides_parameters
-                if i.typ == schema_input.typ
-            )
-            if provided:
-                task_sources.update({(task.index, task.unique_name): provided})
+        Parameters
+        ----------
+        task_provided_parameters : dict, optional
+            The output of `_get_task_provided_parameters` for `new_index`, which may be
+            passed when finding sources for multiple inputs of the same new task, to
+            avoid repeating this for each input.
+
+        """
+
+        if task_provided_parameters is None:
+            task_provided_parameters = self._get_task_provided_parameters(new_index)
 
         out = {
             "imports": {},
-            "tasks": task_sources,
+            "tasks": task_provided_parameters.get(schema_input.typ, {}),
             "has_local": schema_input.typ in new_task.defined_input_types,
             # TODO: there *might* be local definition of a parameter in the form of the input files/writers specified?
             "has_default": schema_input.default_value is not None,
@@ -68,12 +91,13 @@ class WorkflowTemplate:
         default behaviour."""
 
         all_sources = {}
+        task_provided_params = self._get_task_provided_parameters(new_index)
         for schema_input in new_task.all_schema_inputs:
 
             all_sources.update(
                 {
                     schema_input.typ: self.get_possible_input_sources(
-                        schema_input, new_task, new_index
+                        schema_input, new_task, new_index, task_provided_params
                     )
                 }
             )
@@ -173,9 +197,9 @@ class WorkflowTemplate:
                 list(range(next_param_idx, next_param_idx + num_values))
             )
             param_map_idx = len(self.parameter_mapping) - 1
-            input_map_indices[tuple(i.path)] = param_map_idx
+            input_map_indices[i.path] = param_map_idx
             nesting_order_i = (
-                task_template.nesting_order[tuple(i.path)] if num_values > 1 else -1
+                task_template.nesting_order[i.path] if num_values > 1 else -1
             )
             multi.append(
                 {
@@ -205,7 +229,7 @@ class WorkflowTemplate:
                     "inputs": [
                         {
                             "path": k,
-                            "parameter_mapping_index": input_map_indices[tuple(k)],
+                            "parameter_mapping_index": input_map_indices[k],
                             "data_index": v,
                         }
                         for k, v in i["value_index"].items()
@@ -222,9 +246,9 @@ class WorkflowTemplate:
             )
 
         self.element_indices.append(element_indices)
-        self.name_repeat_indices.append(
-            sum(i.template.name == task_template.name for i in self.tasks) + 1
-        )
+        name_repeat_idx = self._task_name_counts.get(task_template.name, 0) + 1
+        self._task_name_counts[task_template.name] = name_repeat_idx
+        self.name_repeat_indices.append(name_repeat_idx)
         task = Task(task_template, self, len(self.tasks))
         self.tasks.add_object(task)
 
@@ -258,14 +282,10 @@ class WorkflowTemplate:
 
             new_elements = []
             for val_idx in range(para_sequences[0]["multiplicity"]):
+                seq_value_index = {i["address"]: val_idx for i in para_sequences}
                 for element in elements:
                     new_elements.append(
-                        {
-                            "value_index": {
-                                **element["value_index"],
-                                **{i["address"]: val_idx for i in para_sequences},
-                            }
-                        }
+                        {"value_index": {**element["value_index"], **seq_value_index}}
                     )
             elements = new_elements
 
@@ -282,16 +302,18 @@ class WorkflowTemplate:
 
     def get_input_values(self, task_index, parameter_path):
         """Get the value of an input for each element in a task."""
+        # resolve the task's element indices once, rather than once per element:
         return [
-            self.get_input_value(
-                task_index=task_index, element_index=i, parameter_path=parameter_path
-            )
-            for i in range(self.tasks[task_index].num_elements)
+            self._get_element_input_value(self.elements[i], parameter_path)
+            for i in self.tasks[task_index].element_indices
         ]
 
     def get_input_value(self, task_index, element_index, parameter_path):
-
         element = self.elements[self.tasks[task_index].element_indices[element_index]]
+        return self._get_element_input_value(element, parameter_path)
+
+    def _get_element_input_value(self, element, parameter_path):
+
         current_value = None
         for input_i in element["inputs"]:
 
@@ -299,20 +321,11 @@ class WorkflowTemplate:
                 input_i["data_index"]
             ]
 
-            is_parent = False
-            is_update = False
-            try:
-                rel_path_parts = get_relative_path(parameter_path, input_i["path"])
-                is_parent = True
-            except ValueError:
-                try:
-                    update_path = get_relative_path(input_i["path"], parameter_path)
-                    is_update = True
-                except ValueError:
-                    pass
-
-            if is_parent:
+            # check the paths before getting the relative path, since most inputs will
+            # be unrelated to `parameter_path`:
+            if is_in_subpath(parameter_path, input_i["path"]):
                 # replace current value:
+                rel_path_parts = get_relative_path(parameter_path, input_i["path"])
                 final_data_path = (param_data_idx, "data", *rel_path_parts)
                 try:
                     current_value = get_in_container(
@@ -324,8 +337,9 @@ class WorkflowTemplate:
                     # traceback.print_exc()
                     pass
 
-            elif is_update:
+            elif is_in_subpath(input_i["path"], parameter_path):
                 # update sub-part of current value
+                update_path = get_relative_path(input_i["path"], parameter_path)
                 update_data = self.parameter_data[param_data_idx][
                     "data"
                 ]  # or use Zarr to get from persistent
@@ -0,0 +1,21 @@
+from hpcflow.environment import ExecutableInstance, NumCores
+
+
+def test_executable_instance_num_cores_from_int():
+    exec_inst = ExecutableInstance(parallel_mode=None, num_cores=2, command="cmd")
+    assert exec_inst.num_cores == NumCores(2, 2)
+
+
+def test_executable_instance_num_cores_from_dict():
+    exec_inst = ExecutableInstance(
+        parallel_mode=None, num_cores={"start": 1, "stop": 4}, command="cmd"
+    )
+    assert exec_inst.num_cores == NumCores(1, 4)
+
+
+def test_executable_instance_num_cores_from_num_cores():
+    num_cores = NumCores(1, 4)
+    exec_inst = ExecutableInstance(
+        parallel_mode=None, num_cores=num_cores, command="cmd"
+    )
+    assert exec_inst.num_cores is num_cores
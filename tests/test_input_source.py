@@ -0,0 +1,45 @@
+import pytest
+
+from hpcflow.parameters import InputSource
+
+
+def test_input_source_tasks_parts():
+    source = InputSource("tasks.t1.outputs")
+    assert (source.source_type, source.task_ref, source.task_source_type) == (
+        "tasks",
+        "t1",
+        "outputs",
+    )
+
+
+def test_input_source_case_insensitive():
+    assert InputSource("Tasks.T1.Inputs").task_source_type == "inputs"
+
+
+def test_input_source_imports_ref():
+    assert InputSource("imports.i1").imports_ref == "i1"
+
+
+def test_input_source_raise_on_unknown_source_type():
+    with pytest.raises(ValueError):
+        InputSource("bad")
+
+
+def test_input_source_raise_on_repeated_invalid_source():
+    # parse errors are not cached, so should be raised on every use:
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            InputSource("local.x")
+
+
+def test_input_source_raise_on_where_with_local():
+    with pytest.raises(ValueError):
+        InputSource("local", where=1)
+
+
+@pytest.mark.parametrize(
+    "source", ["tasks", "tasks.t1", "tasks.t1.outputs.x", "imports", "default.x"]
+)
+def test_input_source_raise_on_wrong_number_of_parts(source):
+    with pytest.raises(ValueError, match="not understood"):
+        InputSource(source)
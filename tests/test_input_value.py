@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 
 from hpcflow.parameters import Parameter, InputValue, ValueSequence
@@ -27,3 +29,19 @@ def test_raise_on_duplicate_input_value_sequence_address_empty():
                 ValueSequence(values=[4, 5, 6]),
             ],
         )
+
+
+def test_deepcopy_shares_parameter_and_copies_value():
+    p1 = Parameter("p1")
+    inp = InputValue(parameter=p1, path=["A"], value={"A": [1, 2]})
+    inp_copy = copy.deepcopy(inp)
+    assert inp_copy == inp
+    assert inp_copy.parameter is p1
+    assert inp_copy.path is not inp.path
+    assert inp_copy.value is not inp.value
+    assert inp_copy.value["A"] is not inp.value["A"]
+
+
+def test_deepcopy_atomic_value():
+    inp = InputValue(parameter=Parameter("p1"), value=1.5)
+    assert copy.deepcopy(inp) == inp
@@ -0,0 +1,34 @@
+import copy
+
+import pytest
+
+from hpcflow.parameters import Parameter, ParameterPropagationMode, SchemaInput
+
+
+def test_deepcopy_returns_same_parameter():
+    p1 = Parameter("p1")
+    assert copy.deepcopy(p1) is p1
+
+
+def test_deepcopy_schema_input_shares_parameter():
+    p1 = Parameter("p1")
+    schema_input = SchemaInput(p1)
+    schema_input_copy = copy.deepcopy(schema_input)
+    assert schema_input_copy is not schema_input
+    assert schema_input_copy.parameter is p1
+
+
+def test_schema_input_from_spec_propagation_mode_case_insensitive():
+    p1 = Parameter("p1")
+    schema_input = SchemaInput.from_spec(
+        {"parameter": "p1", "propagation_mode": "explicit"}, {"p1": p1}
+    )
+    assert schema_input.propagation_mode == ParameterPropagationMode.EXPLICIT
+
+
+def test_schema_input_from_spec_raise_on_invalid_propagation_mode():
+    p1 = Parameter("p1")
+    with pytest.raises(KeyError):
+        SchemaInput.from_spec(
+            {"parameter": "p1", "propagation_mode": "name"}, {"p1": p1}
+        )
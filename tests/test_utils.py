@@ -3,7 +3,9 @@ import pytest
 from hpcflow.utils import (
     get_duplicate_items,
     check_valid_py_identifier,
+    get_relative_path,
     group_by_dict_key_values,
+    is_in_subpath,
 )
 
 
@@ -42,6 +44,20 @@ def test_raise_check_valid_py_identifier_py_keyword():
         check_valid_py_identifier("if")
 
 
+def test_raise_check_valid_py_identifier_leading_underscore():
+    with pytest.raises(ValueError):
+        check_valid_py_identifier("_abc")
+
+
+def test_raise_check_valid_py_identifier_non_alphanumeric_second_char():
+    with pytest.raises(ValueError):
+        check_valid_py_identifier("a-bc")
+
+
+def test_expected_return_check_valid_py_identifier_internal_underscores():
+    assert check_valid_py_identifier("a_b_c") == "a_b_c"
+
+
 def test_expected_return_check_valid_py_identifier_all_latin_alpha():
     assert check_valid_py_identifier("abc") == "abc"
 
@@ -131,3 +147,28 @@ def test_expected_return_group_by_dict_key_values_excluded_items_for_missing_key
         [item_1, item_3],
         [item_2],
     ]
+
+
+def test_is_in_subpath_true():
+    assert is_in_subpath(("A", "B", "C"), ("A",))
+
+
+def test_is_in_subpath_true_equal_paths():
+    assert is_in_subpath(("A", "B"), ("A", "B"))
+
+
+def test_is_in_subpath_false_shorter_path():
+    assert not is_in_subpath(("A",), ("A", "B"))
+
+
+def test_is_in_subpath_false_different_ancestor():
+    assert not is_in_subpath(("A", "B"), ("B",))
+
+
+def test_get_relative_path():
+    assert get_relative_path(("A", "B", "C"), ("A",)) == ("B", "C")
+
+
+def test_get_relative_path_raise_on_not_in_subpath():
+    with pytest.raises(ValueError):
+        get_relative_path(("A", "B"), ("B",))
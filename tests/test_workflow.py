@@ -0,0 +1,33 @@
+import pytest
+
+from hpcflow.actions import Action, ActionEnvironment, ActionScope
+from hpcflow.commands import Command
+from hpcflow.environment import Environment
+from hpcflow.parameters import InputValue, Parameter
+from hpcflow.task import TaskTemplate
+from hpcflow.task_schema import TaskSchema
+from hpcflow.workflow import WorkflowTemplate
+
+
+@pytest.fixture
+def dummy_action():
+    return Action(
+        commands=[Command("ls")],
+        environments=[
+            ActionEnvironment(
+                environment=Environment(name="env_1"), scope=ActionScope.main()
+            )
+        ],
+    )
+
+
+def test_task_unique_names_with_repeated_task_name(dummy_action):
+    p1 = Parameter("p1")
+    schema = TaskSchema("obj", actions=[dummy_action], inputs=[p1])
+    wk = WorkflowTemplate(
+        [
+            TaskTemplate(schema, inputs=[InputValue(p1, value=101)]),
+            TaskTemplate(schema, inputs=[InputValue(p1, value=102)]),
+        ]
+    )
+    assert [i.unique_name for i in wk.tasks] == ["obj", "obj_2"]